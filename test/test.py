@@ -1,9 +1,12 @@
 # SPDX-FileCopyrightText: © 2025 Tiny Tapeout
 # SPDX-License-Identifier: Apache-2.0
 
+import inspect
+import os
+
 import cocotb
 from cocotb.clock import Clock
-from cocotb.triggers import ClockCycles
+from cocotb.triggers import ClockCycles, First, NextTimeStep, ReadOnly, RisingEdge, Timer
 
 from tqv import TinyQV
 
@@ -18,12 +21,26 @@ TAP_INVALID = 0xFFFF
 # 100 cycles, and a read a little under 100 cycles. Leaves time for writing the tap value.
 STANDARD_COUNTDOWN = 0x0000012C
 LARGE_COUNTDOWN = 0x12345678
+# Shortest countdown the RTL accepts (0 does not start the timer), for tests that only need a
+# timeout to occur. The timeout stays pending until a tap or reset, so it is still seen if it
+# fires before the start write returns.
+MIN_COUNTDOWN = 1
+# Reset length between the cases of test_watchdog, the shortest TinyQV.reset() allows
+SHORT_RESET_CYCLES = 3
+# Extra cycles allowed beyond the countdown when waiting for a timeout interrupt
+IRQ_TIMEOUT_MARGIN = 10
+WDT_ENABLE = 0x00     # Write 1 to enable, 0 to disable (also clears interrupt)
+WDT_START = 0x04      # Write 1 to start timer (implicitly enables)
+WDT_COUNTDOWN = 0x08  # R/W 8/16/32-bit countdown value
+WDT_TAP = 0x0C        # Write 0xABCD to reset countdown and clear interrupt
+WDT_STATUS = 0x10     # Read status register
+# Register addresses by name, kept for anything that looks them up by name
 WDT_ADDR = {
-    "enable":     0x00,  # Write 1 to enable, 0 to disable (also clears interrupt)
-    "start":      0x04,  # Write 1 to start timer (implicitly enables)
-    "countdown":  0x08,  # R/W 8/16/32-bit countdown value
-    "tap":        0x0C,  # Write 0xABCD to reset countdown and clear interrupt
-    "status":     0x10,  # Read status register
+    "enable":     WDT_ENABLE,
+    "start":      WDT_START,
+    "countdown":  WDT_COUNTDOWN,
+    "tap":        WDT_TAP,
+    "status":     WDT_STATUS,
 }
 
 
@@ -45,243 +62,269 @@ def decode_wdt_status(status_word: int) -> dict:
     }
 
 
-@cocotb.test()
-async def test_watchdog_interrupt_on_timeout(dut):
-    """Basic test to check that the watchdog timer asserts an interrupt on timeout."""
-    clock = Clock(dut.clk, CLK_PERIOD_NS, units="ns")
-    cocotb.start_soon(clock.start())
-    tqv = TinyQV(dut, PERIPHERAL_NUM)
-    await tqv.reset()
+# Task driving dut.clk, and the TinyQV instance, shared by the tests in this module
+_CLOCK_TASK = None
+_ENV = None
+
 
-    countdown_ticks = 10  # enough to count down in test environment
+def _ensure_clock(dut):
+    """
+    Start the test clock unless it is already running.
+
+    Only one clock ever drives dut.clk.  cocotb kills any tasks a test started
+    when it finishes, so a clock task left over from an earlier test is
+    replaced rather than reused.
+    """
+    global _CLOCK_TASK
+    if _CLOCK_TASK is None or _CLOCK_TASK.done():
+        _CLOCK_TASK = cocotb.start_soon(Clock(dut.clk, CLK_PERIOD_NS, units="ns").start())
 
-    # Set countdown value
-    await tqv.write_word_reg(WDT_ADDR["countdown"], countdown_ticks)
 
-    # Start the watchdog
-    await tqv.write_word_reg(WDT_ADDR["start"], 1)
+async def _env(dut):
+    """Return the shared TinyQV instance, created on first use, with the design freshly reset."""
+    global _ENV
+    _ensure_clock(dut)
+    if _ENV is None:
+        _ENV = TinyQV(dut, PERIPHERAL_NUM)
+    await _ENV.reset()
+    return _ENV
+
+
+async def _short_reset(tqv):
+    """
+    Reset the design between cases with the shortest reset TinyQV allows.
+
+    Only the SPI test harness TinyQV takes a reset length, so fall back to the
+    standard reset for other implementations.
+    """
+    if "cycles" in inspect.signature(tqv.reset).parameters:
+        await tqv.reset(cycles=SHORT_RESET_CYCLES)
+    else:
+        await tqv.reset()
+
+
+async def _write_word_regs(tqv, writes):
+    """
+    Write a list of (reg, value) pairs to word registers, in order.
+
+    The SPI test harness sends these as back to back frames, but that only saves
+    the 2 cycle CS high idle per extra write, out of roughly 260 cycles a write.
+    Other TinyQV implementations only provide write_word_reg, so fall back to that.
+    """
+    if hasattr(tqv, "write_word_regs"):
+        await tqv.write_word_regs(writes)
+    else:
+        for reg, value in writes:
+            await tqv.write_word_reg(reg, value)
+
+
+async def _sample_irq(tqv, dut):
+    """
+    Sample the interrupt once values have settled after the next clock edge.
+
+    The interrupt is read in the ReadOnly phase, so the sample reflects that edge
+    rather than the value from before it.  The caller is left in the ReadOnly
+    phase and must move to a new time step before driving any signals.
+    """
+    await RisingEdge(dut.clk)
+    await ReadOnly()
+    return await tqv.is_interrupt_asserted()
 
-    # Wait for timeout (countdown_ticks + a few cycles)
-    await ClockCycles(dut.clk, countdown_ticks + 3)
 
-    assert await tqv.is_interrupt_asserted(), "Interrupt not asserted on timeout"
+async def _irq_edge(tqv, dut):
+    """Return at the first clock edge after which the interrupt is asserted."""
+    while not await _sample_irq(tqv, dut):
+        pass
 
 
-@cocotb.test()
-async def test_watchdog_tap_prevents_timeout(dut):
+async def _wait_for_interrupt(tqv, dut, cycles):
+    """Wait for the interrupt to assert, giving up after the given number of cycles."""
+    irq = cocotb.start_soon(_irq_edge(tqv, dut))
+    await First(irq, ClockCycles(dut.clk, cycles))
+    irq.kill()
+    await NextTimeStep()
+
+
+async def _check_irq(tqv, dut):
+    """Return whether the interrupt is asserted after the next clock edge."""
+    asserted = await _sample_irq(tqv, dut)
+    await NextTimeStep()
+    return asserted
+
+
+async def _watchdog_interrupt_on_timeout(tqv, dut):
+    """Basic test to check that the watchdog timer asserts an interrupt on timeout."""
+
+    countdown_ticks = MIN_COUNTDOWN
+
+    # Set countdown and start the watchdog
+    await _write_word_regs(tqv, [(WDT_COUNTDOWN, countdown_ticks), (WDT_START, 1)])
+
+    # Wait for timeout
+    await _wait_for_interrupt(tqv, dut, countdown_ticks + IRQ_TIMEOUT_MARGIN)
+
+    assert await _check_irq(tqv, dut), "Interrupt not asserted on timeout"
+
+
+async def _watchdog_tap_prevents_timeout(tqv, dut):
     """Basic test to check that tapping the watchdog prevents an interrupt."""
-    clock = Clock(dut.clk, CLK_PERIOD_NS, units="ns")
-    cocotb.start_soon(clock.start())
-    tqv = TinyQV(dut, PERIPHERAL_NUM)
-    await tqv.reset()
 
     countdown_ticks = STANDARD_COUNTDOWN
 
-    # Set countdown
-    await tqv.write_word_reg(WDT_ADDR["countdown"], countdown_ticks)
-    await tqv.write_word_reg(WDT_ADDR["start"], 1)
+    # Set countdown and start the watchdog
+    await _write_word_regs(tqv, [(WDT_COUNTDOWN, countdown_ticks), (WDT_START, 1)])
 
     # Wait until we have confirmed an interrupt has been asserted
-    await ClockCycles(dut.clk, countdown_ticks)
-    assert await tqv.is_interrupt_asserted(), "Interrupt not asserted on timeout"
+    await _wait_for_interrupt(tqv, dut, countdown_ticks + IRQ_TIMEOUT_MARGIN)
+    assert await _check_irq(tqv, dut), "Interrupt not asserted on timeout"
 
-    # Tap the watchdog to reset countdown and clear interrupt
-    await tqv.write_word_reg(WDT_ADDR["tap"], TAP_MAGIC)
+    # Tap the watchdog to reset countdown and clear interrupt. The write has taken
+    # effect by the time write_word_reg returns, so the interrupt can be checked directly.
+    await tqv.write_word_reg(WDT_TAP, TAP_MAGIC)
 
-    # Wait again a few cycles and then check that the interrupt is not asserted
-    await ClockCycles(dut.clk, countdown_ticks // 10)
+    assert not await _check_irq(tqv, dut), "Interrupt incorrectly asserted after tap"
 
-    assert not await tqv.is_interrupt_asserted(), "Interrupt incorrectly asserted after tap"
 
-
-@cocotb.test()
-async def test_enable_does_not_clear_timeout(dut):
+async def _enable_does_not_clear_timeout(tqv, dut):
     """Writing 0 to enable register should NOT clear a pending timeout."""
-    clock = Clock(dut.clk, CLK_PERIOD_NS, units="ns")
-    cocotb.start_soon(clock.start())
-    tqv = TinyQV(dut, PERIPHERAL_NUM)
-    await tqv.reset()
 
-    countdown_ticks = 10
+    countdown_ticks = MIN_COUNTDOWN
 
-    # Set countdown
-    await tqv.write_word_reg(WDT_ADDR["countdown"], countdown_ticks)
-    await tqv.write_word_reg(WDT_ADDR["start"], 1)
+    # Set countdown and start the watchdog
+    await _write_word_regs(tqv, [(WDT_COUNTDOWN, countdown_ticks), (WDT_START, 1)])
 
     # Wait until we have confirmed an interrupt has been asserted
-    await ClockCycles(dut.clk, countdown_ticks)
-    assert await tqv.is_interrupt_asserted(), "Interrupt not asserted on timeout"
+    await _wait_for_interrupt(tqv, dut, countdown_ticks + IRQ_TIMEOUT_MARGIN)
+    assert await _check_irq(tqv, dut), "Interrupt not asserted on timeout"
 
-    await tqv.write_word_reg(WDT_ADDR["enable"], 0)
+    await tqv.write_word_reg(WDT_ENABLE, 0)
 
-    assert await tqv.is_interrupt_asserted(), "Interrupt cleared by enable write of zero"
+    assert await _check_irq(tqv, dut), "Interrupt cleared by enable write of zero"
 
 
-@cocotb.test()
-async def test_multiple_valid_taps_prevent_interrupt(dut):
+async def _multiple_valid_taps_prevent_interrupt(tqv, dut):
     """Multiple correct taps should keep reloading the countdown and prevent timeout."""
-    clock = Clock(dut.clk, CLK_PERIOD_NS, units="ns")
-    cocotb.start_soon(clock.start())
-    tqv = TinyQV(dut, PERIPHERAL_NUM)
-    await tqv.reset()
 
     countdown_ticks = STANDARD_COUNTDOWN
+    half = countdown_ticks // 2
 
-    # Set countdown
-    await tqv.write_word_reg(WDT_ADDR["countdown"], countdown_ticks)
-    await tqv.write_word_reg(WDT_ADDR["start"], 1)
+    # Set countdown and start the watchdog
+    await _write_word_regs(tqv, [(WDT_COUNTDOWN, countdown_ticks), (WDT_START, 1)])
 
     # Tap the watchdog multiple times within countdown period.
     # The total cycles exceeds countdown_ticks, but the taps should prevent the interrupt.
-    await ClockCycles(dut.clk, countdown_ticks // 2)
-    await tqv.write_word_reg(WDT_ADDR["tap"], TAP_MAGIC)
+    # Nothing is sampled during the delays, so a Timer is used instead of counting clock edges.
+    await Timer(half * CLK_PERIOD_NS, units="ns")
+    await tqv.write_word_reg(WDT_TAP, TAP_MAGIC)
 
-    await ClockCycles(dut.clk, countdown_ticks // 2)
-    await tqv.write_word_reg(WDT_ADDR["tap"], TAP_MAGIC)
+    await Timer(half * CLK_PERIOD_NS, units="ns")
+    await tqv.write_word_reg(WDT_TAP, TAP_MAGIC)
 
-    assert not await tqv.is_interrupt_asserted(), "Interrupt incorrectly asserted after valid taps"
+    assert not await _check_irq(tqv, dut), "Interrupt incorrectly asserted after valid taps"
 
 
-@cocotb.test()
-async def test_tap_with_wrong_value_ignored(dut):
+async def _tap_with_wrong_value_ignored(tqv, dut):
     """Writing incorrect value to tap address should have no effect (timeout occurs)."""
-    clock = Clock(dut.clk, CLK_PERIOD_NS, units="ns")
-    cocotb.start_soon(clock.start())
-    tqv = TinyQV(dut, PERIPHERAL_NUM)
-    await tqv.reset()
 
     countdown_ticks = STANDARD_COUNTDOWN
 
-    # Set countdown
-    await tqv.write_word_reg(WDT_ADDR["countdown"], countdown_ticks)
-    await tqv.write_word_reg(WDT_ADDR["start"], 1)
+    # Set countdown and start the watchdog
+    await _write_word_regs(tqv, [(WDT_COUNTDOWN, countdown_ticks), (WDT_START, 1)])
 
     # Wait until we have confirmed an interrupt has been asserted
-    await ClockCycles(dut.clk, countdown_ticks)
-    assert await tqv.is_interrupt_asserted(), "Interrupt not asserted on timeout"
-
-    # Tap the watchdog with valid number, should *not* reset countdown and clear interrupt
-    await tqv.write_word_reg(WDT_ADDR["tap"], TAP_INVALID)
+    await _wait_for_interrupt(tqv, dut, countdown_ticks + IRQ_TIMEOUT_MARGIN)
+    assert await _check_irq(tqv, dut), "Interrupt not asserted on timeout"
 
-    # Wait again a few cycles and then check that the interrupt is still asserted
-    await ClockCycles(dut.clk, countdown_ticks // 10)
+    # Tap the watchdog with invalid number, should *not* reset countdown and clear interrupt
+    await tqv.write_word_reg(WDT_TAP, TAP_INVALID)
 
-    assert await tqv.is_interrupt_asserted(), "Interrupt cleared by invalid tap"
+    assert await _check_irq(tqv, dut), "Interrupt cleared by invalid tap"
 
 
-@cocotb.test()
-async def test_start_does_not_clear_interrupt(dut):
+async def _start_does_not_clear_interrupt(tqv, dut):
     """Writes to 'start' should not clear timeout."""
-    clock = Clock(dut.clk, CLK_PERIOD_NS, units="ns")
-    cocotb.start_soon(clock.start())
-    tqv = TinyQV(dut, PERIPHERAL_NUM)
-    await tqv.reset()
 
+    # Long enough that, if the start write wrongly cleared the timeout, the interrupt
+    # would still be low when checked after the write.
     countdown_ticks = 50
 
-    # Set countdown
-    await tqv.write_word_reg(WDT_ADDR["countdown"], countdown_ticks)
-    await tqv.write_word_reg(WDT_ADDR["start"], 1)
+    # Set countdown and start the watchdog
+    await _write_word_regs(tqv, [(WDT_COUNTDOWN, countdown_ticks), (WDT_START, 1)])
 
-    await ClockCycles(dut.clk, countdown_ticks)
+    await _wait_for_interrupt(tqv, dut, countdown_ticks + IRQ_TIMEOUT_MARGIN)
 
-    assert await tqv.is_interrupt_asserted(), "Interrupt not asserted on timeout"
+    assert await _check_irq(tqv, dut), "Interrupt not asserted on timeout"
 
     # Writing to start should reload the counter, but not clear any existing interrupt
-    await tqv.write_word_reg(WDT_ADDR["start"], 1)
+    await tqv.write_word_reg(WDT_START, 1)
 
-    assert await tqv.is_interrupt_asserted(), "Write to start incorrectly cleared interrupt"
+    assert await _check_irq(tqv, dut), "Write to start incorrectly cleared interrupt"
 
 
-@cocotb.test()
-async def test_repeated_start_reloads_countdown(dut):
+async def _repeated_start_reloads_countdown(tqv, dut):
     """Multiple writes to 'start' should reload countdown."""
-    clock = Clock(dut.clk, CLK_PERIOD_NS, units="ns")
-    cocotb.start_soon(clock.start())
-    tqv = TinyQV(dut, PERIPHERAL_NUM)
-    await tqv.reset()
 
     # NOTE: The write_word_reg takes enough cycles that we need a long enough WDT cycle such that
     # we allow for about 100 cycles for the final read.
     countdown_ticks = 600
+    third = countdown_ticks // 3
 
-    # Set countdown
-    await tqv.write_word_reg(WDT_ADDR["countdown"], countdown_ticks)
-    await tqv.write_word_reg(WDT_ADDR["start"], 1)
+    # Set countdown and start the watchdog
+    await _write_word_regs(tqv, [(WDT_COUNTDOWN, countdown_ticks), (WDT_START, 1)])
 
-    # Wait 1/4 of the countdown, write to start, wait the rest of the countdown time and check interrupt not asserted
-    await ClockCycles(dut.clk, countdown_ticks // 3)
-    await tqv.write_word_reg(WDT_ADDR["start"], 1)
+    # Wait 1/3 of the countdown, write to start, wait the rest of the countdown time and check interrupt not asserted
+    await Timer(third * CLK_PERIOD_NS, units="ns")
+    await tqv.write_word_reg(WDT_START, 1)
 
-    await ClockCycles(dut.clk, 2 * (countdown_ticks // 3))
+    await ClockCycles(dut.clk, 2 * third)
 
-    assert not await tqv.is_interrupt_asserted(), "Write to start did not reload countdown"
+    assert not await _check_irq(tqv, dut), "Write to start did not reload countdown"
 
 
-@cocotb.test()
-async def test_countdown_value_readback(dut):
+async def _countdown_value_readback(tqv, dut):
     """Read from countdown address should return last written value."""
-    clock = Clock(dut.clk, CLK_PERIOD_NS, units="ns")
-    cocotb.start_soon(clock.start())
-    tqv = TinyQV(dut, PERIPHERAL_NUM)
-    await tqv.reset()
 
     countdown_ticks = LARGE_COUNTDOWN
 
-    await tqv.write_word_reg(WDT_ADDR["countdown"], countdown_ticks)
-    readback = await tqv.read_word_reg(WDT_ADDR["countdown"])
+    await tqv.write_word_reg(WDT_COUNTDOWN, countdown_ticks)
+    readback = await tqv.read_word_reg(WDT_COUNTDOWN)
     assert readback == countdown_ticks, f"Expected 0x{countdown_ticks:08X}, got 0x{readback:08X}"
 
 
-@cocotb.test()
-async def test_partial_write_8bit_zeros_upper_bits(dut):
+async def _partial_write_8bit_zeros_upper_bits(tqv, dut):
     """8-bit write to countdown should zero upper 24 bits."""
-    clock = Clock(dut.clk, CLK_PERIOD_NS, units="ns")
-    cocotb.start_soon(clock.start())
-    tqv = TinyQV(dut, PERIPHERAL_NUM)
-    await tqv.reset()
 
     # Set to known large value first
-    await tqv.write_word_reg(WDT_ADDR["countdown"], LARGE_COUNTDOWN)
+    await tqv.write_word_reg(WDT_COUNTDOWN, LARGE_COUNTDOWN)
 
     # Now write only the low 8 bits
-    await tqv.write_byte_reg(WDT_ADDR["countdown"], 0x42)
+    await tqv.write_byte_reg(WDT_COUNTDOWN, 0x42)
 
-    readback = await tqv.read_word_reg(WDT_ADDR["countdown"])
+    readback = await tqv.read_word_reg(WDT_COUNTDOWN)
     assert readback == 0x00000042, f"Expected 0x00000042, got 0x{readback:08X}"
 
 
-@cocotb.test()
-async def test_partial_write_16bit_zeros_upper_bits(dut):
+async def _partial_write_16bit_zeros_upper_bits(tqv, dut):
     """16-bit write to countdown should zero upper 16 bits."""
-    clock = Clock(dut.clk, CLK_PERIOD_NS, units="ns")
-    cocotb.start_soon(clock.start())
-    tqv = TinyQV(dut, PERIPHERAL_NUM)
-    await tqv.reset()
 
     # Set to known large value first
-    await tqv.write_word_reg(WDT_ADDR["countdown"], LARGE_COUNTDOWN)
+    await tqv.write_word_reg(WDT_COUNTDOWN, LARGE_COUNTDOWN)
 
     # Now write only the low 16 bits
-    await tqv.write_hword_reg(WDT_ADDR["countdown"], 0xFFFF)
+    await tqv.write_hword_reg(WDT_COUNTDOWN, 0xFFFF)
 
-    readback = await tqv.read_word_reg(WDT_ADDR["countdown"])
+    readback = await tqv.read_word_reg(WDT_COUNTDOWN)
     assert readback == 0x0000FFFF, f"Expected 0x0000BEEF, got 0x{readback:08X}"
 
 
-@cocotb.test()
-async def test_start_without_countdown_value(dut):
+async def _start_without_countdown_value(tqv, dut):
     """Starting the watchdog without setting countdown should not start the timer."""
-    clock = Clock(dut.clk, CLK_PERIOD_NS, units="ns")
-    cocotb.start_soon(clock.start())
-    tqv = TinyQV(dut, PERIPHERAL_NUM)
-    await tqv.reset()
 
     # Do not set countdown, just issue start
-    await tqv.write_word_reg(WDT_ADDR["start"], 1)
+    await tqv.write_word_reg(WDT_START, 1)
 
     # Read status register
-    status_word = await tqv.read_word_reg(WDT_ADDR["status"])
+    status_word = await tqv.read_word_reg(WDT_STATUS)
     status = decode_wdt_status(status_word)
 
     assert not status["enabled"], "Status: expected enabled=0 without countdown"
@@ -290,22 +333,16 @@ async def test_start_without_countdown_value(dut):
     assert not status["counter_active"], "Status: expected counter=0"
 
 
-@cocotb.test()
-async def test_status_after_start(dut):
+async def _status_after_start(tqv, dut):
     """Status register reflects enabled=1, started=1, counter!=0 before timeout."""
-    clock = Clock(dut.clk, CLK_PERIOD_NS, units="ns")
-    cocotb.start_soon(clock.start())
-    tqv = TinyQV(dut, PERIPHERAL_NUM)
-    await tqv.reset()
 
     countdown_ticks = 200
 
     # Set countdown and start the watchdog
-    await tqv.write_word_reg(WDT_ADDR["countdown"], countdown_ticks)
-    await tqv.write_word_reg(WDT_ADDR["start"], 1)
+    await _write_word_regs(tqv, [(WDT_COUNTDOWN, countdown_ticks), (WDT_START, 1)])
 
     # Read the status register
-    status_word = await tqv.read_word_reg(WDT_ADDR["status"])
+    status_word = await tqv.read_word_reg(WDT_STATUS)
     status = decode_wdt_status(status_word)
 
     assert status["enabled"], "Status: expected enabled=1"
@@ -314,25 +351,19 @@ async def test_status_after_start(dut):
     assert status["counter_active"], "Status: expected counter!=0"
 
 
-@cocotb.test()
-async def test_status_after_timeout(dut):
+async def _status_after_timeout(tqv, dut):
     """Status register reflects timeout_pending=1 after timer expiry."""
-    clock = Clock(dut.clk, CLK_PERIOD_NS, units="ns")
-    cocotb.start_soon(clock.start())
-    tqv = TinyQV(dut, PERIPHERAL_NUM)
-    await tqv.reset()
 
-    countdown_ticks = 10
+    countdown_ticks = MIN_COUNTDOWN
 
     # Set countdown and start the watchdog
-    await tqv.write_word_reg(WDT_ADDR["countdown"], countdown_ticks)
-    await tqv.write_word_reg(WDT_ADDR["start"], 1)
+    await _write_word_regs(tqv, [(WDT_COUNTDOWN, countdown_ticks), (WDT_START, 1)])
 
-    await ClockCycles(dut.clk, countdown_ticks)
-    assert await tqv.is_interrupt_asserted(), "Interrupt not asserted on timeout"
+    await _wait_for_interrupt(tqv, dut, countdown_ticks + IRQ_TIMEOUT_MARGIN)
+    assert await _check_irq(tqv, dut), "Interrupt not asserted on timeout"
 
     # Read the status register
-    status_word = await tqv.read_word_reg(WDT_ADDR["status"])
+    status_word = await tqv.read_word_reg(WDT_STATUS)
     status = decode_wdt_status(status_word)
 
     assert status["enabled"], "Status: expected enabled=1 after timeout"
@@ -341,17 +372,58 @@ async def test_status_after_timeout(dut):
     assert not status["counter_active"], "Status: expected counter=0 after timeout"
 
 
-@cocotb.test()
-async def test_disable_before_start_has_no_effect(dut):
+async def _disable_before_start_has_no_effect(tqv, dut):
     """Disabling before watchdog is started should have no effect and not assert interrupt."""
-    clock = Clock(dut.clk, CLK_PERIOD_NS, units="ns")
-    cocotb.start_soon(clock.start())
-    tqv = TinyQV(dut, PERIPHERAL_NUM)
-    await tqv.reset()
 
     # Write 0 to disable (has no effect before start)
-    await tqv.write_word_reg(WDT_ADDR["enable"], 0)
+    await tqv.write_word_reg(WDT_ENABLE, 0)
 
     # Wait a few cycles and confirm no spurious interrupt
     await ClockCycles(dut.clk, 10)
-    assert not await tqv.is_interrupt_asserted(), "Unexpected interrupt before WDT was started"
+    assert not await _check_irq(tqv, dut), "Unexpected interrupt before WDT was started"
+
+
+# Every watchdog case, run in order by test_watchdog
+WDT_CASES = (
+    _watchdog_interrupt_on_timeout,
+    _watchdog_tap_prevents_timeout,
+    _enable_does_not_clear_timeout,
+    _multiple_valid_taps_prevent_interrupt,
+    _tap_with_wrong_value_ignored,
+    _start_does_not_clear_interrupt,
+    _repeated_start_reloads_countdown,
+    _countdown_value_readback,
+    _partial_write_8bit_zeros_upper_bits,
+    _partial_write_16bit_zeros_upper_bits,
+    _start_without_countdown_value,
+    _status_after_start,
+    _status_after_timeout,
+    _disable_before_start_has_no_effect,
+)
+
+
+def _split_test(case):
+    """Wrap a single case as its own cocotb test, named after the case."""
+    async def run(dut):
+        tqv = await _env(dut)
+        await case(tqv, dut)
+
+    run.__name__ = run.__qualname__ = f"test{case.__name__}"
+    run.__doc__ = case.__doc__
+    return cocotb.test()(run)
+
+
+if os.getenv("SPLIT_TESTS"):
+    # Register each case as a separate test, which is easier to debug
+    for _case in WDT_CASES:
+        globals()[f"test{_case.__name__}"] = _split_test(_case)
+else:
+    @cocotb.test()
+    async def test_watchdog(dut):
+        """Run every watchdog case in one test, resetting the design between cases."""
+        tqv = await _env(dut)
+        for i, case in enumerate(WDT_CASES):
+            if i > 0:
+                await _short_reset(tqv)
+            dut._log.debug("Running %s", case.__name__[1:])
+            await case(tqv, dut)
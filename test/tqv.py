@@ -3,7 +3,7 @@
 
 from cocotb.triggers import ClockCycles
 
-from tqv_reg import spi_write_cpha0, spi_read_cpha0
+from tqv_reg import spi_write_cpha0, spi_write_batch_cpha0, spi_read_cpha0
 
 # This class provides access to the peripheral's registers.
 # This implementation uses the SPI interface embedded in this project,
@@ -16,15 +16,26 @@ class TinyQV:
 
     # Reset the design, this reset will initialize TinyQV and connect
     # all inputs and outputs to your peripheral.
-    async def reset(self):
-        self.dut._log.info("Reset")
+    # cycles is how long reset is held.  It must be at least 3, so the
+    # SPI CS synchronizer has settled before reset is released, otherwise
+    # the SPI block sees a stale CS falling edge and starts a frame.
+    async def reset(self, cycles=10):
+        assert cycles >= 3
+        self.dut._log.debug("Reset")
         self.dut.ena.value = 1
         self.dut.ui_in.value = 0
         self.dut.uio_in.value = 0
         self.dut.rst_n.value = 0
-        await ClockCycles(self.dut.clk, 10)
+        await ClockCycles(self.dut.clk, cycles)
         self.dut.rst_n.value = 1  
-        assert self.dut.uio_oe.value == 0b00001011
+        assert int(self.dut.uio_oe.value) == 0b00001011
+
+    # Write a list of (reg, value) pairs to word registers, in order.
+    # This is only provided by the SPI test harness.  Back to back frames
+    # skip the CS high idle at the start of each frame after the first,
+    # saving a couple of cycles per extra write.
+    async def write_word_regs(self, writes):
+        await spi_write_batch_cpha0(self.dut.clk, self.dut.uio_in, [(reg, value, 2) for reg, value in writes])
 
     # Write a value to a byte register in your design
     # reg is the address of the register in the range 0-15
@@ -64,4 +75,4 @@ class TinyQV:
     
     # Check whether the user interrupt is asserted
     async def is_interrupt_asserted(self):
-        return self.dut.uio_out[0].value == 1
+        return int(self.dut.uio_out[0].value) == 1
@@ -54,12 +54,15 @@ def spi_miso_read(port):
 
 SPI_HALF_CYCLE_DELAY = 2
 
-async def spi_write_cpha0 (clk, port, address, data, width):
+async def spi_write_cpha0 (clk, port, address, data, width, cs_idle=True):
 
-  temp = port.value;
-  result = pull_cs_high(temp)
-  port.value = result
-  await ClockCycles(clk, SPI_HALF_CYCLE_DELAY)
+  # The leading CS high period can be skipped when the previous frame
+  # has just finished with CS high.
+  if cs_idle:
+    temp = port.value;
+    result = pull_cs_high(temp)
+    port.value = result
+    await ClockCycles(clk, SPI_HALF_CYCLE_DELAY)
 
   # Pull CS low + Write command bit - bit 31 - MSBIT in first word
   temp = port.value;
@@ -151,6 +154,17 @@ async def spi_write_cpha0 (clk, port, address, data, width):
   await ClockCycles(clk, SPI_HALF_CYCLE_DELAY)  
 
 
+# Send a sequence of (address, data, width) writes as back to back frames.
+# The SPI register block returns to idle at the end of every frame, so each
+# write still needs its own CS low period, but the CS high idle ending one
+# frame is reused as the start of the next rather than being repeated.
+async def spi_write_batch_cpha0 (clk, port, writes):
+  cs_idle = True
+  for address, data, width in writes:
+    await spi_write_cpha0(clk, port, address, data, width, cs_idle)
+    cs_idle = False
+
+
 async def spi_read_cpha0 (clk, port_in, port_out, data_ready, address, data, width):
   
   temp = port_in.value;
@@ -224,7 +238,7 @@ async def spi_read_cpha0 (clk, port_in, port_out, data_ready, address, data, wid
 
   await ClockCycles(clk, 1)
   data_ready_delay = 0
-  while data_ready.value == 0:
+  while int(data_ready.value) == 0:
     data_ready_delay += 1
     assert data_ready_delay < 100
     await ClockCycles(clk, 1)